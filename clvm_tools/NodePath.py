@@ -61,6 +61,8 @@ class NodePath:
     Use 1-based paths
     """
 
+    __slots__ = ("_index",)
+
     def __init__(self, index=1):
         if index < 0:
             byte_count = (index.bit_length() + 7) >> 3
@@ -1,7 +1,7 @@
 from typing import Dict
 
 from clvm import KEYWORD_FROM_ATOM, KEYWORD_TO_ATOM
-from clvm.casts import int_from_bytes, int_to_bytes
+from clvm.casts import int_to_bytes
 from clvm.SExp import SExp
 
 from ir.reader import read_ir
@@ -12,14 +12,32 @@ from ir.utils import (
 )
 from ir.Type import Type
 
+# sexps are immutable, so keywords in plain SExp trees can share one node
+KEYWORD_SEXPS = {keyword: SExp.to(atom) for keyword, atom in KEYWORD_TO_ATOM.items()}
+
 
 def assemble_from_ir(ir_sexp):
+    # loop down the list rather than recursing per item, so long lists fit the stack
+    items = []
+    while ir_listp(ir_sexp) and not ir_nullp(ir_sexp):
+        items.append(assemble_from_ir(ir_first(ir_sexp)))
+        ir_sexp = ir_rest(ir_sexp)
+
+    sexp = assemble_atom_from_ir(ir_sexp)
+    for item in reversed(items):
+        sexp = item.cons(sexp)
+    return sexp
+
+
+def assemble_atom_from_ir(ir_sexp):
     keyword = ir_as_symbol(ir_sexp)
     if keyword:
         if keyword[:1] == "#":
             keyword = keyword[1:]
         atom = KEYWORD_TO_ATOM.get(keyword)
         if atom is not None:
+            if type(ir_sexp) is SExp:
+                return KEYWORD_SEXPS[keyword]
             return ir_sexp.to(atom)
         if True:
             return ir_val(ir_sexp)
@@ -29,35 +47,25 @@ def assemble_from_ir(ir_sexp):
     if not ir_listp(ir_sexp):
         return ir_val(ir_sexp)
 
-    if ir_nullp(ir_sexp):
-        return ir_sexp.to([])
-
-    # handle "q"
-    first = ir_first(ir_sexp)
-    keyword = ir_as_symbol(first)
-    if keyword == "q":
-        pass
-        # TODO: note that any symbol is legal after this point
-
-    sexp_1 = assemble_from_ir(first)
-    sexp_2 = assemble_from_ir(ir_rest(ir_sexp))
-    return sexp_1.cons(sexp_2)
+    return ir_sexp.to([])
 
 
 printable_chars = ("0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
     "!#$%&'()*+,-./:;<=>?@[\]^_`{|}~ ")
 
+printable_char_set = frozenset(printable_chars)
+
 
 def type_for_atom(atom) -> Type:
     if len(atom) > 2:
         try:
             v = bytes(atom).decode("utf8")
-            if all(c in printable_chars for c in v):
+            if printable_char_set.issuperset(v):
                 return Type.QUOTES
         except UnicodeDecodeError:
             pass
         return Type.HEX
-    if int_to_bytes(int_from_bytes(atom)) == atom:
+    if int_to_bytes(int.from_bytes(atom, "big", signed=True)) == atom:
         return Type.INT
     return Type.HEX
 
@@ -66,13 +74,21 @@ def disassemble_to_ir(sexp, keyword_from_atom, allow_keyword=None):
     if is_ir(sexp) and allow_keyword is not False:
         return ir_cons(ir_symbol("ir"), sexp)
 
-    if sexp.listp():
+    items = []
+    while sexp.listp():
         if sexp.first().listp() or allow_keyword is None:
             allow_keyword = True
-        v0 = disassemble_to_ir(sexp.first(), keyword_from_atom, allow_keyword=allow_keyword)
-        v1 = disassemble_to_ir(sexp.rest(), keyword_from_atom, allow_keyword=False)
-        return ir_cons(v0, v1)
+        items.append(disassemble_to_ir(sexp.first(), keyword_from_atom, allow_keyword=allow_keyword))
+        sexp = sexp.rest()
+        allow_keyword = False
+
+    r = disassemble_atom_to_ir(sexp, keyword_from_atom, allow_keyword)
+    for item in reversed(items):
+        r = ir_cons(item, r)
+    return r
+
 
+def disassemble_atom_to_ir(sexp, keyword_from_atom, allow_keyword):
     as_atom = sexp.as_atom()
     if allow_keyword:
         v = keyword_from_atom.get(as_atom)
@@ -1,27 +1,21 @@
 import argparse
+import functools
 import importlib
 import io
-import json
-import pathlib
 import sys
 import time
 
-from clvm import to_sexp_f, KEYWORD_FROM_ATOM, KEYWORD_TO_ATOM, SExp
-import clvm_tools_rs
+from clvm import to_sexp_f, KEYWORD_FROM_ATOM, SExp
 from clvm.EvalError import EvalError
 from clvm.serialize import sexp_from_stream, sexp_to_stream
-from clvm.operators import OP_REWRITE
 
 from ir import reader
 
 from . import binutils
-from .debug import make_trace_pre_eval, trace_to_text, trace_to_table
 from .sha256tree import sha256tree
 
-try:
-    from clvm_rs import run_serialized_chia_program, MEMPOOL_MODE
-except ImportError:
-    run_serialized_chia_program = None
+# the serialized `()`, used as the environment when none is given
+NULL_ENV_SERIALIZED = b"\x80"
 
 
 def path_or_code(arg):
@@ -38,7 +32,8 @@ def stream_to_bin(write_f):
     return b.getvalue()
 
 
-def call_tool(tool_name, desc, conversion, input_args):
+@functools.lru_cache(maxsize=None)
+def tool_parser(desc):
     parser = argparse.ArgumentParser(description=desc)
     parser.add_argument(
         "-H", "--script-hash", action="store_true", help="Show only sha256 tree hash of program"
@@ -49,6 +44,11 @@ def call_tool(tool_name, desc, conversion, input_args):
         type=path_or_code,
         help="path to clvm script, or literal script",
     )
+    return parser
+
+
+def call_tool(tool_name, desc, conversion, input_args):
+    parser = tool_parser(desc)
 
     sys.setrecursionlimit(20000)
     args = parser.parse_args(args=input_args[1:])
@@ -91,13 +91,41 @@ def stage_import(stage):
         raise ValueError("bad stage: %s" % stage)
 
 
-def as_bin(streamer_f):
-    f = io.BytesIO()
-    streamer_f(f)
-    return f.getvalue()
+# only short texts, like environments, are worth keeping parsed in memory
+MAX_CACHED_IR_TEXT = 1024
+
+
+@functools.lru_cache(maxsize=16)
+def read_short_ir(text):
+    return reader.read_ir(text)
+
+
+def read_ir_cached(text):
+    if len(text) > MAX_CACHED_IR_TEXT:
+        return reader.read_ir(text)
+    return read_short_ir(text)
+
+
+# stage wrapper programs are module-level constants, so serialize them once
+@functools.lru_cache(maxsize=None)
+def stage_program_bin(stage, tool_name):
+    return getattr(stage, tool_name).as_bin()
+
+
+# building a stage's run_program copies the operator table, so reuse it
+@functools.lru_cache(maxsize=None)
+def stage_run_program(stage, search_paths):
+    if hasattr(stage, "run_program_for_search_paths"):
+        return stage.run_program_for_search_paths(search_paths)
+    return stage.run_program
+
+
+as_bin = stream_to_bin
 
 
 def run(args=sys.argv):
+    import clvm_tools_rs
+
     sys.stdout.write(bytes(clvm_tools_rs.launch_tool("run", args, 2)).decode('utf8'))
 
 
@@ -105,8 +133,10 @@ def brun(args=sys.argv):
     return launch_tool(args, "brun")
 
 
-def launch_tool(args, tool_name, default_stage=0):
-    sys.setrecursionlimit(20000)
+@functools.lru_cache(maxsize=None)
+def launch_tool_parser(default_stage):
+    import pathlib
+
     parser = argparse.ArgumentParser(
         description='Execute a clvm script.'
     )
@@ -161,42 +191,69 @@ def launch_tool(args, tool_name, default_stage=0):
     parser.add_argument(
         "env", nargs="?", type=path_or_code,
         help="clvm script environment, as clvm src, or hex")
+    return parser
+
+
+# `clvm_rs` is optional; look it up once rather than retrying a failed import
+@functools.lru_cache(maxsize=None)
+def rust_backend():
+    try:
+        from clvm_rs import run_serialized_chia_program, MEMPOOL_MODE
+    except ImportError:
+        return None, None
+    return run_serialized_chia_program, MEMPOOL_MODE
+
+
+def launch_tool(args, tool_name, default_stage=0):
+    # these are only needed here, so `opc`, `opd` and `read_ir` don't pay for them
+    import json
+
+    from .debug import make_trace_pre_eval, trace_to_text, trace_to_table
+
+    run_serialized_chia_program, MEMPOOL_MODE = rust_backend()
+
+    sys.setrecursionlimit(20000)
+    parser = launch_tool_parser(default_stage)
 
     args = parser.parse_args(args=args[1:])
 
     keywords = {} if args.no_keywords else KEYWORD_FROM_ATOM
 
-    if hasattr(args.stage, "run_program_for_search_paths"):
-        run_program = args.stage.run_program_for_search_paths(args.include)
-    else:
-        run_program = args.stage.run_program
+    run_program = stage_run_program(args.stage, tuple(args.include))
+
+    # with --hex the program and environment stay serialized; otherwise they
+    # stay as assembled sexps, and each backend converts only what it needs
+    program = arg = None
+    program_serialized = arg_serialized = None
 
-    program_serialized = None
-    arg_serialized = None
+    # only read the clock when the timings will be printed
+    now = time.perf_counter_ns if args.time else (lambda: 0)
 
-    time_start = time.perf_counter()
+    time_start = now()
     if args.hex:
         program_serialized = bytes.fromhex(args.path_or_code)
-        if not args.env:
-            args.env = "80"
-        arg_serialized = bytes.fromhex(args.env)
-        time_read_hex = time.perf_counter()
+        if args.env:
+            arg_serialized = bytes.fromhex(args.env)
+        else:
+            arg_serialized = NULL_ENV_SERIALIZED
+        time_read_hex = now()
 
     else:
 
         src_text = args.path_or_code
         try:
-            src_sexp = reader.read_ir(src_text)
+            src_sexp = read_ir_cached(src_text)
         except SyntaxError as ex:
             print("FAIL: %s" % (ex))
             return -1
-        program_serialized = binutils.assemble_from_ir(src_sexp).as_bin()
-        if not args.env:
-            args.env = "()"
-        env_ir = reader.read_ir(args.env)
-        arg_serialized = binutils.assemble_from_ir(env_ir).as_bin()
+        program = binutils.assemble_from_ir(src_sexp)
+        if args.env:
+            env_ir = read_ir_cached(args.env)
+            arg = binutils.assemble_from_ir(env_ir)
+        else:
+            arg = program.null()
 
-        time_assemble = time.perf_counter()
+        time_assemble = now()
 
     pre_eval_f = None
     symbol_table = None
@@ -211,8 +268,12 @@ def launch_tool(args, tool_name, default_stage=0):
         pre_eval_f = make_trace_pre_eval(log_entries)
 
     if hasattr(args.stage, tool_name):
-        arg_serialized = b"\xff" + program_serialized + arg_serialized
-        program_serialized = getattr(args.stage, tool_name).as_bin()
+        if args.hex:
+            arg_serialized = b"".join((b"\xff", program_serialized, arg_serialized))
+            program_serialized = stage_program_bin(args.stage, tool_name)
+        else:
+            arg = program.cons(arg)
+            program = getattr(args.stage, tool_name)
 
     cost = 0
     try:
@@ -232,7 +293,10 @@ def launch_tool(args, tool_name, default_stage=0):
 
         max_cost = args.max_cost
         if use_rust:
-            time_parse_input = time.perf_counter()
+            if not args.hex:
+                program_serialized = program.as_bin()
+                arg_serialized = arg.as_bin()
+            time_parse_input = now()
 
             try:
                 cost, result = run_serialized_chia_program(
@@ -244,25 +308,26 @@ def launch_tool(args, tool_name, default_stage=0):
             except ValueError as ve:
                 err = EvalError(ve.args[0], ve.args[1])
                 raise err
-            time_done = time.perf_counter()
+            time_done = now()
             result = SExp.to(result)
         else:
-            program = sexp_from_stream(io.BytesIO(program_serialized), to_sexp_f)
-            arg = sexp_from_stream(io.BytesIO(arg_serialized), to_sexp_f)
+            if args.hex:
+                program = sexp_from_stream(io.BytesIO(program_serialized), to_sexp_f)
+                arg = sexp_from_stream(io.BytesIO(arg_serialized), to_sexp_f)
 
-            time_parse_input = time.perf_counter()
+            time_parse_input = now()
             cost, result = run_program(
                 program, arg, max_cost=max_cost, pre_eval_f=pre_eval_f, strict=args.mempool | args.strict)
-            time_done = time.perf_counter()
+            time_done = now()
         if args.cost:
             print("cost = %d" % cost)
         if args.time:
             if args.hex:
-                print('read_hex: %f' % (time_read_hex - time_start))
+                print('read_hex: %f' % ((time_read_hex - time_start) / 1e9))
             else:
-                print('assemble_from_ir: %f' % (time_assemble - time_start))
-                print('to_sexp_f: %f' % (time_parse_input - time_assemble))
-            print('run_program: %f' % (time_done - time_parse_input))
+                print('assemble_from_ir: %f' % ((time_assemble - time_start) / 1e9))
+                print('to_sexp_f: %f' % ((time_parse_input - time_assemble) / 1e9))
+            print('run_program: %f' % ((time_done - time_parse_input) / 1e9))
         if args.dump:
             blob = as_bin(lambda f: sexp_to_stream(result, f))
             output = blob.hex()
@@ -1,12 +1,30 @@
 import hashlib
 
+ATOM_PREFIX = b"\1"
+PAIR_PREFIX = b"\2"
+
 
 def sha256tree(v):
-    pair = v.pair
-    if pair:
-        left = sha256tree(pair[0])
-        right = sha256tree(pair[1])
-        s = b"\2" + left + right
-    else:
-        s = b"\1" + v.atom
-    return hashlib.sha256(s).digest()
+    # walk the tree with an explicit stack so deep trees don't hit the
+    # recursion limit; `None` marks a pair whose children have been hashed
+    hashes = []
+    stack = [v]
+    while stack:
+        v = stack.pop()
+        if v is None:
+            right = hashes.pop()
+            h = hashlib.sha256(PAIR_PREFIX)
+            h.update(hashes.pop())
+            h.update(right)
+            hashes.append(h.digest())
+            continue
+        pair = v.pair
+        if pair:
+            stack.append(None)
+            stack.append(pair[1])
+            stack.append(pair[0])
+        else:
+            h = hashlib.sha256(ATOM_PREFIX)
+            h.update(v.atom)
+            hashes.append(h.digest())
+    return hashes[0]
@@ -42,25 +42,26 @@ def next_cons_token(stream: Stream) -> Token:
 
 
 def tokenize_cons(token: str, offset: int, stream: Stream) -> CLVMObject:
-    if token == ")":
-        return ir_new(Type.NULL, 0, offset)
+    items = []
+    while token != ")":
+        items.append((tokenize_sexp(token, offset, stream), offset))
 
-    initial_offset = offset
-
-    first_sexp = tokenize_sexp(token, offset, stream)
-
-    token, offset = next_cons_token(stream)
-    if token == ".":
-        dot_offset = offset
-        # grab the last item
-        token, offset = next_cons_token(stream)
-        rest_sexp = tokenize_sexp(token, offset, stream)
         token, offset = next_cons_token(stream)
-        if token != ")":
-            raise SyntaxError("illegal dot expression at %s" % dot_offset)
+        if token == ".":
+            dot_offset = offset
+            # grab the last item
+            token, offset = next_cons_token(stream)
+            rest_sexp = tokenize_sexp(token, offset, stream)
+            token, offset = next_cons_token(stream)
+            if token != ")":
+                raise SyntaxError("illegal dot expression at %s" % dot_offset)
+            break
     else:
-        rest_sexp = tokenize_cons(token, offset, stream)
-    return ir_cons(first_sexp, rest_sexp, initial_offset)
+        rest_sexp = ir_new(Type.NULL, 0, offset)
+
+    for first_sexp, initial_offset in reversed(items):
+        rest_sexp = ir_cons(first_sexp, rest_sexp, initial_offset)
+    return rest_sexp
 
 
 def tokenize_int(token: str, offset: int) -> Optional[CLVMObject]:
@@ -1,6 +1,6 @@
 import typing
 
-from clvm import casts, SExp
+from clvm import SExp
 
 from .Type import Type, CONS_TYPES
 
@@ -32,11 +32,11 @@ def ir_type(ir_sexp: SExp) -> int:
     if the_type.listp():
         the_type = the_type.first()
 
-    return casts.int_from_bytes(the_type.as_atom())
+    return int.from_bytes(the_type.as_atom(), "big", signed=True)
 
 
 def ir_as_int(ir_sexp: SExp) -> int:
-    return casts.int_from_bytes(ir_as_atom(ir_sexp))
+    return int.from_bytes(ir_as_atom(ir_sexp), "big", signed=True)
 
 
 def ir_offset(ir_sexp: SExp) -> int:
@@ -45,7 +45,7 @@ def ir_offset(ir_sexp: SExp) -> int:
         the_offset = the_offset.rest().as_atom()
     else:
         the_offset = b"\xff"
-    return casts.int_from_bytes(the_offset)
+    return int.from_bytes(the_offset, "big", signed=True)
 
 
 def ir_val(ir_sexp: SExp) -> SExp:
@@ -109,7 +109,7 @@ def is_ir(sexp) -> bool:
     if f is None or len(f) > 1:
         return False
 
-    the_type = casts.int_from_bytes(f)
+    the_type = int.from_bytes(f, "big", signed=True)
     try:
         t = Type(the_type)
     except ValueError:
@@ -3,7 +3,7 @@
 import io
 from typing import Iterator
 
-from clvm import casts, SExp
+from clvm import SExp
 from clvm.serialize import sexp_to_stream
 
 from .Type import Type
@@ -48,9 +48,9 @@ def iter_ir_format(ir_sexp: SExp) -> Iterator[str]:
     atom = ir_as_atom(ir_sexp)
 
     if type == Type.INT:
-        yield "%d" % casts.int_from_bytes(atom)
+        yield "%d" % int.from_bytes(atom, "big", signed=True)
     elif type == Type.NODE:
-        yield "NODE[%d]" % casts.int_from_bytes(atom)
+        yield "NODE[%d]" % int.from_bytes(atom, "big", signed=True)
     elif type == Type.HEX:
         yield "0x%s" % atom.hex()
     elif type == Type.QUOTES:
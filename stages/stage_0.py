@@ -1,9 +1,23 @@
+import functools
+
 from clvm import run_program as default_run_program  # noqa
 from clvm.operators import OPERATOR_LOOKUP, OperatorDict
 from clvm.EvalError import EvalError
 
 from clvm_tools import binutils
 
+
+def fatal_error(op, arguments):
+    raise EvalError("unimplemented operator", arguments.to(op))
+
+
+# built on the first strict run rather than at import, so operators added to
+# `OPERATOR_LOOKUP` before then are included; later additions are not
+@functools.lru_cache(maxsize=None)
+def strict_operator_lookup():
+    return OperatorDict(OPERATOR_LOOKUP, unknown_op_handler=fatal_error)
+
+
 def run_program(
     program,
     args,
@@ -13,9 +27,10 @@ def run_program(
     strict=False,
 ):
     if strict:
-        def fatal_error(op, arguments):
-            raise EvalError("unimplemented operator", arguments.to(op))
-        operator_lookup = OperatorDict(operator_lookup, unknown_op_handler=fatal_error)
+        if operator_lookup is OPERATOR_LOOKUP:
+            operator_lookup = strict_operator_lookup()
+        else:
+            operator_lookup = OperatorDict(operator_lookup, unknown_op_handler=fatal_error)
 
     return default_run_program(
         program,
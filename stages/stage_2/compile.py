@@ -3,17 +3,10 @@ from clvm_tools.binutils import disassemble
 from clvm_tools.NodePath import LEFT, TOP
 
 from .defaults import default_macro_lookup
-from .helpers import brun, eval, quote
+from .helpers import APPLY_ATOM, CONS_ATOM, QUOTE_ATOM, brun, eval, quote
 from .mod import compile_mod
 
-QUOTE_ATOM = KEYWORD_TO_ATOM["q"]
-APPLY_ATOM = KEYWORD_TO_ATOM["a"]
-CONS_ATOM = KEYWORD_TO_ATOM["c"]
-
-PASS_THROUGH_OPERATORS = set(KEYWORD_TO_ATOM.values())
-
-for _ in "com opt".split():
-    PASS_THROUGH_OPERATORS.add(_.encode("utf8"))
+PASS_THROUGH_OPERATORS = frozenset(KEYWORD_TO_ATOM.values()).union((b"com", b"opt"))
 
 
 def compile_qq(args, macro_lookup, symbol_table, run_program, level=1):
@@ -22,7 +22,7 @@ goals is to compile PROG as much as possible.
 """
 
 
-DEFAULT_MACROS_SRC = [
+DEFAULT_MACROS_SRC = (
     """
     ; we have to compile this externally, since it uses itself
     ;(defmacro defmacro (name params body)
@@ -78,7 +78,7 @@ DEFAULT_MACROS_SRC = [
     # / operator at the clvm layer is becoming deprecated and
     # will be implemented using divmod.
     """(defmacro / (A B) (qq (f (divmod (unquote A) (unquote B)))))""",
-]
+)
 
 
 DEFAULT_MACRO_LOOKUP = None
@@ -4,6 +4,10 @@ from clvm_tools.NodePath import TOP
 
 QUOTE_ATOM = KEYWORD_TO_ATOM["q"]
 APPLY_ATOM = KEYWORD_TO_ATOM["a"]
+FIRST_ATOM = KEYWORD_TO_ATOM["f"]
+REST_ATOM = KEYWORD_TO_ATOM["r"]
+CONS_ATOM = KEYWORD_TO_ATOM["c"]
+RAISE_ATOM = KEYWORD_TO_ATOM["x"]
 
 
 def quote(sexp):
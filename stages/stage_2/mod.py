@@ -1,16 +1,10 @@
-from clvm import KEYWORD_TO_ATOM
-
 from clvm_tools import binutils
 from clvm_tools.debug import build_symbol_dump
 from clvm_tools.NodePath import LEFT, RIGHT, TOP
 
-from .helpers import eval, quote
+from .helpers import CONS_ATOM, eval, quote
 from .optimize import optimize_sexp
 
-
-QUOTE_ATOM = KEYWORD_TO_ATOM["q"]
-CONS_ATOM = KEYWORD_TO_ATOM["c"]
-
 MAIN_NAME = b""
 
 
@@ -1,17 +1,8 @@
-from clvm import KEYWORD_TO_ATOM
-
 from clvm_tools.pattern_match import match
 from clvm_tools.binutils import assemble
 
 from clvm_tools.NodePath import NodePath, LEFT, RIGHT
-from .helpers import quote
-
-QUOTE_ATOM = KEYWORD_TO_ATOM["q"]
-APPLY_ATOM = KEYWORD_TO_ATOM["a"]
-FIRST_ATOM = KEYWORD_TO_ATOM["f"]
-REST_ATOM = KEYWORD_TO_ATOM["r"]
-CONS_ATOM = KEYWORD_TO_ATOM["c"]
-RAISE_ATOM = KEYWORD_TO_ATOM["x"]
+from .helpers import FIRST_ATOM, QUOTE_ATOM, RAISE_ATOM, REST_ATOM, quote
 
 DEBUG_OPTIMIZATIONS = 0
 
@@ -240,6 +231,18 @@ def apply_null_optimizer(r, eval):
     return r
 
 
+OPTIMIZERS = (
+    cons_optimizer,
+    constant_optimizer,
+    cons_q_a_optimizer,
+    var_change_optimizer_cons_eval,
+    children_optimizer,
+    path_optimizer,
+    quote_null_optimizer,
+    apply_null_optimizer,
+)
+
+
 def optimize_sexp(r, eval):
     """
     Optimize an s-expression R written for clvm to R_opt where
@@ -248,17 +251,6 @@ def optimize_sexp(r, eval):
     if r.nullp() or not r.listp():
         return r
 
-    OPTIMIZERS = [
-        cons_optimizer,
-        constant_optimizer,
-        cons_q_a_optimizer,
-        var_change_optimizer_cons_eval,
-        children_optimizer,
-        path_optimizer,
-        quote_null_optimizer,
-        apply_null_optimizer,
-    ]
-
     while r.listp():
         start_r = r
         for opt in OPTIMIZERS:
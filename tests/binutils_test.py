@@ -0,0 +1,47 @@
+from clvm import SExp
+
+from clvm_tools.binutils import assemble, assemble_from_ir, disassemble
+from clvm_tools.cmds import opc
+from ir.reader import read_ir
+
+
+LONG_LIST = "(%s)" % " ".join(["100"] * 2000)
+
+
+def test_long_list_round_trip(low_recursion_limit):
+    assert disassemble(assemble(LONG_LIST)) == LONG_LIST
+
+
+def test_opc_long_list(low_recursion_limit, capsys):
+    opc(["opc", LONG_LIST])
+    assert capsys.readouterr().out == "ff64" * 2000 + "80\n"
+
+
+def test_dotted_tail_round_trip():
+    for text in ["(a 2 . 3)", "(100 200 . \"abc\")", "((100 . 2) . 3)", "(q . 1)"]:
+        assert disassemble(assemble(text)) == text
+
+
+def test_keywords_only_in_operator_position():
+    # 2 and 3 are the atoms for `a` and `i`, but only the head of a list is
+    # rendered as a keyword
+    assert disassemble(assemble("(a 2 3)")) == "(a 2 3)"
+    assert disassemble(assemble("(c (q . 1) (f 1))")) == "(c (q . 1) (f 1))"
+    assert disassemble(assemble("((a 2 3) 2 (i 2 3 4))")) == "((a 2 3) 2 (i 2 3 4))"
+
+
+class Program(SExp):
+    pass
+
+
+def test_assemble_keeps_sexp_subclass():
+    sexp = assemble_from_ir(Program.to(read_ir("(a (q . 1) (c 2 3))")))
+
+    def classes(sexp):
+        yield type(sexp)
+        if sexp.listp():
+            yield from classes(sexp.first())
+            yield from classes(sexp.rest())
+
+    assert set(classes(sexp)) == {Program}
+    assert disassemble(sexp) == "(a (q . 1) (c 2 3))"
@@ -0,0 +1,15 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def low_recursion_limit(monkeypatch):
+    # hold the limit well under the 2000-item lists the long-list tests use,
+    # even for tools that raise it themselves
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(1000)
+    monkeypatch.setattr(sys, "setrecursionlimit", lambda limit: None)
+    yield
+    monkeypatch.undo()
+    sys.setrecursionlimit(old_limit)
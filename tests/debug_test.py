@@ -0,0 +1,33 @@
+from clvm_tools.binutils import assemble, disassemble
+from clvm_tools.debug import make_trace_pre_eval
+
+from stages.stage_0 import run_program
+
+
+def test_trace_records_reductions():
+    log_entries = []
+    pre_eval_f = make_trace_pre_eval(log_entries)
+
+    finished_f = pre_eval_f(assemble("(+ 2 5)"), assemble("(100 200)"))
+    pre_eval_f(assemble("(x)"), assemble("()"))
+    finished_f(assemble("30"))
+
+    assert [
+        (disassemble(form), disassemble(env), None if rv is None else disassemble(rv))
+        for form, env, rv in log_entries
+    ] == [
+        ("(+ 2 5)", "(100 200)", "30"),
+        ("(x)", "()", None),
+    ]
+
+
+def test_trace_from_run_program():
+    log_entries = []
+    pre_eval_f = make_trace_pre_eval(log_entries)
+    cost, result = run_program(
+        assemble("(+ 2 5)"), assemble("(10 20)"), pre_eval_f=pre_eval_f
+    )
+    assert disassemble(result) == "30"
+    assert [
+        (disassemble(form), disassemble(rv)) for form, env, rv in log_entries
+    ] == [("(+ 2 5)", "30"), ("5", "20"), ("2", "10")]
@@ -8,3 +8,10 @@ def test_tokenize_comments():
     t = read_ir(script_source)
     s = write_ir(t)
     assert s == expected_output
+
+
+def test_long_list_round_trip(low_recursion_limit):
+    script_source = "(%s)" % " ".join(["1"] * 2000)
+    t = read_ir(script_source)
+    s = write_ir(t)
+    assert s == script_source
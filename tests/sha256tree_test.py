@@ -0,0 +1,41 @@
+import hashlib
+import sys
+
+from clvm import SExp
+
+from clvm_tools.binutils import assemble
+from clvm_tools.sha256tree import sha256tree
+
+
+def test_sha256tree_nil():
+    assert sha256tree(SExp.null()).hex() == (
+        "4bf5122f344554c53bde2ebb8cd2b7e3d1600ad631c385a5d7cce23c7785459a"
+    )
+
+
+def test_sha256tree_small():
+    # (1 . 2) => sha256(2 + sha256(1 + 0x01) + sha256(1 + 0x02))
+    left = hashlib.sha256(b"\1\1").digest()
+    right = hashlib.sha256(b"\1\2").digest()
+    expected = hashlib.sha256(b"\2" + left + right).digest()
+    assert sha256tree(assemble("(1 . 2)")) == expected
+
+
+def test_sha256tree_deep():
+    depth = sys.getrecursionlimit() * 4
+    nil = SExp.null()
+    nil_hash = hashlib.sha256(b"\1").digest()
+
+    # nest on both sides so neither branch of the walk can recurse
+    left_deep = nil
+    right_deep = nil
+    expected_left = nil_hash
+    expected_right = nil_hash
+    for _ in range(depth):
+        left_deep = left_deep.cons(nil)
+        right_deep = nil.cons(right_deep)
+        expected_left = hashlib.sha256(b"\2" + expected_left + nil_hash).digest()
+        expected_right = hashlib.sha256(b"\2" + nil_hash + expected_right).digest()
+
+    assert sha256tree(left_deep) == expected_left
+    assert sha256tree(right_deep) == expected_right